@@ -2,13 +2,19 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import asyncio
+import contextlib
 import io
 from datetime import datetime, timezone
 import aiohttp
 import logging
-import matplotlib.pyplot as plt
+import orjson
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
 import unicodedata
 import os
+import re
+import sys
+import time
 
 import config
 from config import is_server_allowed, has_permission, is_bot_owner
@@ -16,24 +22,70 @@ from config import is_server_allowed, has_permission, is_bot_owner
 
 # --- Configuration from config.py ---
 REQUEST_TIMEOUT = 1
-BADGE_FETCH_DELAY = 0.1
 MAX_CONCURRENT_REQUESTS = 5
+ROBLOX_RATE_LIMIT = 60  # requests per ROBLOX_RATE_PERIOD, shared by all checks
+ROBLOX_RATE_PERIOD = 60
+BADGE_RATE_LIMIT = 10  # badge pages per second; pagination has its own bucket
 FILTER_CHANNEL_ID = config.FILTER_CHECK["result_channels"]
 MAIN_GROUP = config.FILTER_CHECK["main_group"]
-MAIN_DIVISIONS = config.FILTER_CHECK["main_divisions"]
-SUB_DIVISIONS = config.FILTER_CHECK["sub_divisions"]
+MAIN_DIVISIONS = frozenset(config.FILTER_CHECK["main_divisions"])
+SUB_DIVISIONS = frozenset(config.FILTER_CHECK["sub_divisions"])
 INTELLIGENCE_GROUPS = []
 
 # Trello Configuration
 TRELLO_API_KEY = os.getenv("TRELLO_API_KEY")
 TRELLO_TOKEN = os.getenv("TRELLO_TOKEN")
 TRELLO_BOARD_ID = config.FILTER_CHECK["trello_board_id"]
-MAJOR_BLACKLIST_CATEGORIES = config.FILTER_CHECK["major_blacklist_categories"]
+MAJOR_BLACKLIST_CATEGORIES = frozenset(config.FILTER_CHECK["major_blacklist_categories"])
 DENY_BLACKLIST_CATEGORIES = config.FILTER_CHECK["deny_blacklist_categories"]
-SKIP_CATEGORIES = config.FILTER_CHECK["skip_categories"]
+# Case-insensitive "contains any deny category"; None when no categories are configured
+_DENY_PATTERN = re.compile(
+    "|".join(re.escape(c) for c in DENY_BLACKLIST_CATEGORIES), re.IGNORECASE
+) if DENY_BLACKLIST_CATEGORIES else None
+SKIP_CATEGORIES = frozenset(config.FILTER_CHECK["skip_categories"])
+TRELLO_CACHE_TTL = 90
+USER_CACHE_TTL = 60
+USER_CACHE_SIZE = 256
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session, owned by the FilterCheck cog (see FilterCheck.get_session)
+_shared_session: aiohttp.ClientSession | None = None
+
+
+# Recent lookups, so re-checking the same user skips the Roblox/Discord calls
+_roblox_user_cache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+_discord_user_cache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+_social_count_cache = TTLCache(maxsize=USER_CACHE_SIZE * 4, ttl=USER_CACHE_TTL)
+
+# Caps in-flight Roblox requests and their rate across concurrent /check runs
+_roblox_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+_roblox_limiter = AsyncLimiter(ROBLOX_RATE_LIMIT, ROBLOX_RATE_PERIOD)
+_badges_limiter = AsyncLimiter(BADGE_RATE_LIMIT, 1)
+
+
+@contextlib.asynccontextmanager
+async def roblox_request(session: aiohttp.ClientSession, method: str, url: str, limiter: AsyncLimiter | None = None, **kwargs):
+    """session.request wrapped in the shared Roblox concurrency and rate limits.
+
+    Read the status and body inside the block and report errors after it,
+    so a slot is never held across the webhook/interaction round trips.
+    """
+    async with _roblox_semaphore, limiter or _roblox_limiter:
+        async with session.request(method, url, **kwargs) as res:
+            yield res
+
+
+# Python 3.11+ parses the trailing "Z" Roblox and Trello use natively
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime:
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
+
 # --- Error reporting ---
 async def report_error(interaction: discord.Interaction | None, message: str, level: str = "error", user_message: str | None = None):
     """Unified error/warning reporter."""
@@ -44,15 +96,15 @@ async def report_error(interaction: discord.Interaction | None, message: str, le
     else:
         logger.error(message)
 
-    if config.ERROR_WEBHOOK_URL:
-        async with aiohttp.ClientSession() as session:
-            try:
-                await session.post(
-                    config.ERROR_WEBHOOK_URL,
-                    json={"content": f"⚠️ {level.upper()}: {message}"},
-                )
-            except Exception as e:
-                logger.error(f"Failed to send error webhook: {e}")
+    if config.ERROR_WEBHOOK_URL and _shared_session and not _shared_session.closed:
+        try:
+            async with _shared_session.post(
+                config.ERROR_WEBHOOK_URL,
+                json={"content": f"⚠️ {level.upper()}: {message}"},
+            ):
+                pass
+        except Exception as e:
+            logger.error(f"Failed to send error webhook: {e}")
 
     if interaction:
         try:
@@ -78,19 +130,18 @@ HOMOGLYPHS = {
 
 INVISIBLE_CHARS = ["\u200b", "\u200c", "\u200d", "\u2060", "\ufeff"]
 
+# Built once so normalization is a single str.translate pass
+_INVISIBLE_TABLE = str.maketrans("", "", "".join(INVISIBLE_CHARS))
+_NORMALIZE_TABLE = {**str.maketrans(HOMOGLYPHS), **_INVISIBLE_TABLE}
+
 
 def remove_invisible(text: str) -> str:
-    for ch in INVISIBLE_CHARS:
-        text = text.replace(ch, "")
-    return text
+    return text.translate(_INVISIBLE_TABLE)
 
 
 def normalize_text(text: str) -> str:
     text = unicodedata.normalize("NFKD", text)
-    text = remove_invisible(text)
-    for bad, good in HOMOGLYPHS.items():
-        text = text.replace(bad, good)
-    return text
+    return text.translate(_NORMALIZE_TABLE)
 
 
 # --- All your existing helper functions remain the same ---
@@ -102,52 +153,46 @@ def normalize_text(text: str) -> str:
 
 async def fetch_roblox_user_data(session: aiohttp.ClientSession, username: str, interaction: discord.Interaction | None = None):
     """Fetch comprehensive Roblox user data with improved error handling and rate limiting."""
+    cache_key = username.lower()
+    cached = _roblox_user_cache.get(cache_key)
+    if cached:
+        return cached
+
     timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
     user_id = None
 
     try:
-        async with session.post(f"https://users.roblox.com/v1/usernames/users", json={"usernames": [username]}, timeout=timeout) as res:
-            if res.status != 200:
-                await report_error(interaction, f"Failed to fetch user ID for Roblox username {username}: status {res.status}", level="error")
-                return None
-            data = await res.json()
-            if not data.get("data"):
-                await report_error(interaction, f"Roblox user **{username}** not found.", user_message=f"❌ Roblox user **{username}** not found.", level="error")
-                return None
-            user_id = data["data"][0]["id"]
-
-        async with session.get(f"https://users.roblox.com/v1/users/{user_id}", timeout=timeout) as res:
-            if res.status == 404:
-                await report_error(interaction, f"Roblox user with ID {user_id} not found. (404)", user_message=f"❌ Roblox user with ID **{user_id}** was not found.", level="error")
-                return None
-            if res.status != 200:
-                await report_error(interaction, f"Failed to fetch user info for Roblox ID {user_id}: status {res.status}", level="error")
-                return None
-            data = await res.json()
-            username = data.get("name")
-            created_str = data.get("created")
-            if not username or not created_str:
-                await report_error(interaction, f"Invalid user data for Roblox ID {user_id}", level="error")
-                return None
-            created_date = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-            account_age_days = (datetime.now(timezone.utc) - created_date).days
+        async with roblox_request(session, "POST", f"https://users.roblox.com/v1/usernames/users", json={"usernames": [username]}, timeout=timeout) as res:
+            status = res.status
+            data = orjson.loads(await res.read()) if status == 200 else None
+        if data is None:
+            await report_error(interaction, f"Failed to fetch user ID for Roblox username {username}: status {status}", level="error")
+            return None
+        if not data.get("data"):
+            await report_error(interaction, f"Roblox user **{username}** not found.", user_message=f"❌ Roblox user **{username}** not found.", level="error")
+            return None
+        user_id = data["data"][0]["id"]
+
+        details, can_view, followers, following, friends = await asyncio.gather(
+            fetch_roblox_user_details(session, user_id, timeout, interaction),
+            fetch_inventory_visibility(session, user_id, timeout, interaction),
+            fetch_social_count(session, user_id, "followers", timeout, interaction),
+            fetch_social_count(session, user_id, "followings", timeout, interaction),
+            fetch_social_count(session, user_id, "friends", timeout, interaction),
+        )
+        if not details or can_view is None:
+            return None
+        username, created_date = details
+        account_age_days = (datetime.now(timezone.utc) - created_date).days
+
+        if not can_view:
+            await report_error(interaction, f"Roblox user **{username} ({user_id})** has their inventory set to private.", user_message=f"❌ Roblox user **{username} ({user_id})** has their inventory set to private.", level="error")
+            return None
 
-        async with session.get(f"https://inventory.roblox.com/v1/users/{user_id}/can-view-inventory", timeout=timeout) as res:
-            if res.status != 200:
-                await report_error(interaction, f"Failed to fetch inventory visibility for Roblox ID {user_id}: status {res.status}", level="error")
-                return None
-            data = await res.json()
-            if not data.get("canView", False):
-                await report_error(interaction, f"Roblox user **{username} ({user_id})** has their inventory set to private.", user_message=f"❌ Roblox user **{username} ({user_id})** has their inventory set to private.", level="error")
-                return None
-
-        followers = await fetch_social_count(session, user_id, "followers", timeout, interaction)
-        following = await fetch_social_count(session, user_id, "followings", timeout, interaction)
-        friends = await fetch_social_count(session, user_id, "friends", timeout, interaction)
         badges, badge_count = await fetch_user_badges_with_count(session, user_id)
         badge_pages = (badge_count + 29) // 30
 
-        return {
+        user_data = {
             "username": username,
             "user_id": user_id,
             "account_age_days": account_age_days,
@@ -155,9 +200,12 @@ async def fetch_roblox_user_data(session: aiohttp.ClientSession, username: str,
             "followers": followers,
             "following": following,
             "friends": friends,
+            "badges": badges,
             "badge_count": badge_count,
             "badge_pages": badge_pages
         }
+        _roblox_user_cache[cache_key] = user_data
+        return user_data
     except asyncio.TimeoutError:
         await report_error(interaction, f"Timeout fetching data for Roblox user **{username} ({user_id})**", level="error")
         return None
@@ -166,50 +214,100 @@ async def fetch_roblox_user_data(session: aiohttp.ClientSession, username: str,
         return None
 
 
+async def fetch_roblox_user_details(session: aiohttp.ClientSession, user_id: int, timeout: aiohttp.ClientTimeout, interaction: discord.Interaction | None = None):
+    """Return (username, created_date) for a Roblox user ID, or None on failure."""
+    async with roblox_request(session, "GET", f"https://users.roblox.com/v1/users/{user_id}", timeout=timeout) as res:
+        status = res.status
+        data = orjson.loads(await res.read()) if status == 200 else None
+    if status == 404:
+        await report_error(interaction, f"Roblox user with ID {user_id} not found. (404)", user_message=f"❌ Roblox user with ID **{user_id}** was not found.", level="error")
+        return None
+    if data is None:
+        await report_error(interaction, f"Failed to fetch user info for Roblox ID {user_id}: status {status}", level="error")
+        return None
+    username = data.get("name")
+    created_str = data.get("created")
+    if not username or not created_str:
+        await report_error(interaction, f"Invalid user data for Roblox ID {user_id}", level="error")
+        return None
+    return username, _parse_iso(created_str)
+
+
+async def fetch_inventory_visibility(session: aiohttp.ClientSession, user_id: int, timeout: aiohttp.ClientTimeout, interaction: discord.Interaction | None = None):
+    """Return whether the user's inventory is public, or None on failure."""
+    async with roblox_request(session, "GET", f"https://inventory.roblox.com/v1/users/{user_id}/can-view-inventory", timeout=timeout) as res:
+        status = res.status
+        data = orjson.loads(await res.read()) if status == 200 else None
+    if data is None:
+        await report_error(interaction, f"Failed to fetch inventory visibility for Roblox ID {user_id}: status {status}", level="error")
+        return None
+    return data.get("canView", False)
+
+
 async def fetch_social_count(session: aiohttp.ClientSession, user_id: int, endpoint: str, timeout: aiohttp.ClientTimeout, interaction: discord.Interaction | None = None) -> int:
+    cache_key = (user_id, endpoint)
+    if cache_key in _social_count_cache:
+        return _social_count_cache[cache_key]
+
     try:
-        async with session.get(f"https://friends.roblox.com/v1/users/{user_id}/{endpoint}/count", timeout=timeout) as res:
-            if res.status == 200:
-                data = await res.json()
-                return data.get("count", 0)
-            else:
-                await report_error(interaction, f"Error fetching {endpoint} for user {user_id}: status {res.status}", level="error")
-                return 0
+        async with roblox_request(session, "GET", f"https://friends.roblox.com/v1/users/{user_id}/{endpoint}/count", timeout=timeout) as res:
+            status = res.status
+            data = orjson.loads(await res.read()) if status == 200 else None
+        if data is None:
+            await report_error(interaction, f"Error fetching {endpoint} for user {user_id}: status {status}", level="error")
+            return 0
+        count = data.get("count", 0)
+        _social_count_cache[cache_key] = count
+        return count
     except Exception as e:
         await report_error(interaction, f"Error fetching {endpoint} for user {user_id}: {e}", level="error")
         return 0
 
 
+async def fetch_badge_page(session: aiohttp.ClientSession, user_id: int, cursor: str | None, timeout: aiohttp.ClientTimeout):
+    """Fetch one 100-badge page. Returns (status, data); data is None on a non-200 response."""
+    url = f"https://badges.roblox.com/v1/users/{user_id}/badges?limit=100"
+    if cursor:
+        url += f"&cursor={cursor}"
+    async with roblox_request(session, "GET", url, limiter=_badges_limiter, timeout=timeout) as res:
+        if res.status != 200:
+            return res.status, None
+        return res.status, orjson.loads(await res.read())
+
+
 async def fetch_user_badges_with_count(session: aiohttp.ClientSession, user_id: int, interaction: discord.Interaction | None = None):
     badges = []
     badge_count = 0
-    cursor = None
     timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    next_page = asyncio.create_task(fetch_badge_page(session, user_id, None, timeout))
 
     try:
-        while True:
-            url = f"https://badges.roblox.com/v1/users/{user_id}/badges?limit=100"
+        while next_page:
+            status, data = await next_page
+            next_page = None
+            if data is None:
+                await report_error(interaction, f"Failed to fetch badges for user {user_id}: {status}", level="error")
+                break
+
+            # Pages are cursor-linked, so request the next one as soon as its
+            # cursor is known and parse this page while it is in flight
+            cursor = data.get("nextPageCursor")
             if cursor:
-                url += f"&cursor={cursor}"
-            async with session.get(url, timeout=timeout) as res:
-                if res.status != 200:
-                    await report_error(interaction, f"Failed to fetch badges for user {user_id}: {res.status}", level="error")
-                    break
-                data = await res.json()
-                badges_data = data.get("data", [])
-                badge_count += len(badges_data)
-                for badge in badges_data:
-                    if "created" in badge:
-                        badges.append({
-                            "name": badge["name"],
-                            "creation_date": datetime.fromisoformat(badge["created"].replace("Z", "+00:00"))
-                        })
-                cursor = data.get("nextPageCursor")
-                if not cursor:
-                    break
-                await asyncio.sleep(BADGE_FETCH_DELAY)
+                next_page = asyncio.create_task(fetch_badge_page(session, user_id, cursor, timeout))
+
+            badges_data = data.get("data", [])
+            badge_count += len(badges_data)
+            for badge in badges_data:
+                if "created" in badge:
+                    badges.append({
+                        "name": badge["name"],
+                        "creation_date": _parse_iso(badge["created"])
+                    })
     except Exception as e:
         await report_error(interaction, f"Error fetching badges for user {user_id}: {e}", level="error")
+    finally:
+        if next_page:
+            next_page.cancel()
 
     return badges, badge_count
 
@@ -218,41 +316,73 @@ async def generate_badge_growth_graph(badges, account_created_date, username, us
     if not badges:
         await report_error(interaction, f"No badges to generate graph for {username} ({user_id}).", level="warning")
         return None
-    valid_badges = [b for b in badges if b["creation_date"] > account_created_date]
-    if not valid_badges:
-        await report_error(interaction, f"No valid badges after filtering by account creation for {username} ({user_id}).", level="warning")
-        return None
-    valid_badges.sort(key=lambda x: x["creation_date"])
-    dates = [account_created_date] + [b["creation_date"] for b in valid_badges]
-    cumulative = [0] + list(range(1, len(valid_badges) + 1))
 
     try:
-        plt.figure(figsize=(10, 5))
-        plt.step(dates, cumulative, where='post', color='green')
-        plt.xlabel("Date")
-        plt.ylabel("Cumulative Badges")
-        plt.title(f"{username} ({user_id}) Badge Growth")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png')
-        plt.close()
-        buf.seek(0)
-        return buf
+        buf = await asyncio.to_thread(
+            _render_graph_sync, badges, account_created_date, f"{username} ({user_id}) Badge Growth")
     except Exception as e:
         await report_error(interaction, f"Error generating badge graph for {username} ({user_id}): {e}", level="error")
         return None
 
+    if buf is None:
+        await report_error(interaction, f"No valid badges after filtering by account creation for {username} ({user_id}).", level="warning")
+    return buf
+
+
+# numpy/matplotlib are heavy and only needed for graphs, so they are imported
+# on first use (inside the worker thread) rather than when the cog loads
+_np = None
+_Figure = None
+
+
+def _load_graph_modules():
+    global _np, _Figure
+    if _Figure is None:
+        import numpy
+        from matplotlib.figure import Figure
+        _np, _Figure = numpy, Figure
+    return _np, _Figure
+
+
+def _render_graph_sync(badges, account_created_date, title: str) -> io.BytesIO | None:
+    """Render the badge step graph to PNG, or None if no badge postdates the account.
+    Blocking, so run it in a worker thread."""
+    np, Figure = _load_graph_modules()
+
+    # Naive UTC datetime64 values; every date was parsed as UTC
+    created = np.datetime64(account_created_date.replace(tzinfo=None), 'us')
+    badge_dates = np.array([b["creation_date"].replace(tzinfo=None) for b in badges], dtype='datetime64[us]')
+    badge_dates = np.sort(badge_dates[badge_dates > created])
+    if not badge_dates.size:
+        return None
+    dates = np.concatenate(([created], badge_dates))
+    cumulative = np.arange(dates.size)
+
+    # A bare Figure (no pyplot) keeps no global state and is safe off the main thread
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
+    ax.step(dates, cumulative, where='post', color='green')
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Cumulative Badges")
+    ax.set_title(title)
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=80)
+    buf.seek(0)
+    return buf
+
 
 async def get_user_divisions(session: aiohttp.ClientSession, roblox_id: int, interaction: discord.Interaction | None = None):
     url = f"https://groups.roblox.com/v1/users/{roblox_id}/groups/roles"
     try:
-        async with session.get(url) as res:
-            if res.status != 200:
-                await report_error(interaction, f"Failed to fetch groups: status {res.status}", level="warning")
-                return [], [], None, []
-            data = await res.json()
-            groups = data.get("data", [])
+        async with roblox_request(session, "GET", url) as res:
+            status = res.status
+            data = orjson.loads(await res.read()) if status == 200 else None
+        if data is None:
+            await report_error(interaction, f"Failed to fetch groups: status {status}", level="warning")
+            return [], [], None, []
+        groups = data.get("data", [])
 
         main_divisions = []
         sub_divisions = []
@@ -271,8 +401,13 @@ async def get_user_divisions(session: aiohttp.ClientSession, roblox_id: int, int
             if group_id == MAIN_GROUP:
                 main_group = (group_name, role_name)
 
-            gn = normalize_text(group_name.lower())
-            rn = normalize_text(role_name.lower())
+            # ASCII names are unchanged by normalization, so only pay for it otherwise
+            gn = group_name.lower()
+            rn = role_name.lower()
+            if not gn.isascii():
+                gn = normalize_text(gn)
+            if not rn.isascii():
+                rn = normalize_text(rn)
             if "intelligence" in gn or "intelligence" in rn:
                 intelligence_groups.append((group_name, role_name))
 
@@ -283,16 +418,23 @@ async def get_user_divisions(session: aiohttp.ClientSession, roblox_id: int, int
 
 
 async def fetch_discord_user_info(bot: discord.Client, discord_id: int, interaction: discord.Interaction | None = None):
+    cached = _discord_user_cache.get(discord_id)
+    if cached:
+        return cached
+
     try:
-        user: discord.User = await bot.fetch_user(discord_id)
+        # Members of any guild the bot shares are already cached (members intent)
+        user: discord.User = bot.get_user(discord_id) or await bot.fetch_user(discord_id)
         account_age_days = (discord.utils.utcnow() - user.created_at).days
-        return {
+        user_info = {
             "id": user.id,
             "username": f"{user.name}#{user.discriminator}",
             "account_age_days": account_age_days,
             "bot": user.bot,
             "avatar_url": str(user.avatar.url) if user.avatar else None
         }
+        _discord_user_cache[discord_id] = user_info
+        return user_info
     except discord.NotFound:
         await report_error(interaction, f"Discord user with ID {discord_id} not found.", user_message=f"❌ Discord user with ID **{discord_id}** was not found.", level="error")
         return None
@@ -301,44 +443,78 @@ async def fetch_discord_user_info(bot: discord.Client, discord_id: int, interact
         return None
 
 
-async def check_trello_blacklist(identifiers: list[str], interaction: discord.Interaction | None = None):
-    url = (
-        f"https://api.trello.com/1/boards/{TRELLO_BOARD_ID}/lists"
-        f"?cards=all&card_fields=name,due&fields=name"
-        f"&key={TRELLO_API_KEY}&token={TRELLO_TOKEN}"
-    )
-    major_blacklists = []
-    blacklists = []
+# Board snapshot shared by every check; refreshed at most once per TRELLO_CACHE_TTL
+_trello_cache = {"data": None, "fetched_at": 0.0}
+_trello_lock = asyncio.Lock()
+
+
+async def fetch_trello_lists(session: aiohttp.ClientSession, interaction: discord.Interaction | None = None):
+    """Return the non-skipped lists (with cards), reusing the cached snapshot while it is fresh."""
+    async with _trello_lock:
+        if _trello_cache["data"] is not None and time.monotonic() - _trello_cache["fetched_at"] < TRELLO_CACHE_TTL:
+            return _trello_cache["data"]
+
+        auth = f"key={TRELLO_API_KEY}&token={TRELLO_TOKEN}"
+        url = f"https://api.trello.com/1/boards/{TRELLO_BOARD_ID}/lists?fields=name&{auth}"
+        async with session.get(url) as res:
+            if res.status != 200:
+                await report_error(interaction, f"Failed to fetch Trello board: status {res.status}", level="warning")
+                return None
+            board_lists = orjson.loads(await res.read())
+
+        # Only pull cards for lists that are actually checked
+        relevant = [l for l in board_lists if l["name"] not in SKIP_CATEGORIES]
+        card_lists = await asyncio.gather(*(
+            fetch_trello_list_cards(session, l["id"], auth, interaction) for l in relevant))
+        if any(cards is None for cards in card_lists):
+            return None
+        lists = [{"name": l["name"], "cards": cards} for l, cards in zip(relevant, card_lists)]
+
+        _trello_cache["data"] = lists
+        _trello_cache["fetched_at"] = time.monotonic()
+        return lists
+
+
+async def fetch_trello_list_cards(session: aiohttp.ClientSession, list_id: str, auth: str, interaction: discord.Interaction | None = None):
+    # /cards/all keeps archived cards, matching the old ?cards=all board fetch
+    url = f"https://api.trello.com/1/lists/{list_id}/cards/all?fields=name,due&{auth}"
+    async with session.get(url) as res:
+        if res.status != 200:
+            await report_error(interaction, f"Failed to fetch Trello list {list_id}: status {res.status}", level="warning")
+            return None
+        return orjson.loads(await res.read())
+
+
+async def check_trello_blacklist(session: aiohttp.ClientSession, identifiers: list[str], interaction: discord.Interaction | None = None):
+    # Dicts keep first-seen order while deduplicating in O(1)
+    major_blacklists = {}
+    blacklists = {}
     now = datetime.now(timezone.utc)
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as res:
-                if res.status != 200:
-                    await report_error(interaction, f"Failed to fetch Trello board: status {res.status}", level="warning")
-                    return None
-                lists = await res.json()
+        lists = await fetch_trello_lists(session, interaction)
+        if lists is None:
+            return None
+
+        # One case-insensitive scan per card instead of one per identifier
+        identifier_pattern = re.compile("|".join(re.escape(i) for i in identifiers if i), re.IGNORECASE)
 
         for trello_list in lists:
             list_name = trello_list["name"]
-            if list_name in SKIP_CATEGORIES:
-                continue
             for card in trello_list.get("cards", []):
                 card_name = card["name"]
                 due_str = card.get("due")
                 if due_str:
-                    due_date = datetime.fromisoformat(due_str.replace("Z", "+00:00"))
+                    due_date = _parse_iso(due_str)
                     if due_date < now:
                         continue
-                if any(identifier.lower() in card_name.lower() for identifier in identifiers):
+                if identifier_pattern.search(card_name):
                     if list_name in MAJOR_BLACKLIST_CATEGORIES:
-                        if list_name not in major_blacklists:
-                            major_blacklists.append(list_name)
+                        major_blacklists[list_name] = None
                     else:
-                        if list_name not in blacklists:
-                            blacklists.append(list_name)
+                        blacklists[list_name] = None
 
-        return {"major_blacklists": major_blacklists, "blacklists": blacklists}
+        return {"major_blacklists": list(major_blacklists), "blacklists": list(blacklists)}
     except Exception as e:
         await report_error(interaction, f"Exception checking Trello blacklists: {e}", level="error")
         return None
@@ -351,6 +527,33 @@ class FilterCheck(commands.Cog):
         self.session = None
         self.session_lock = asyncio.Lock()
 
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the cog's shared HTTP session, creating it on first use"""
+        global _shared_session
+        async with self.session_lock:
+            if self.session is None or self.session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=MAX_CONCURRENT_REQUESTS * 4,
+                    limit_per_host=MAX_CONCURRENT_REQUESTS,
+                    ttl_dns_cache=300
+                )
+                self.session = aiohttp.ClientSession(
+                    connector=connector,
+                    json_serialize=lambda obj: orjson.dumps(obj).decode()
+                )
+                _shared_session = self.session
+            return self.session
+
+    async def cog_load(self):
+        await self.get_session()
+
+    async def cog_unload(self):
+        global _shared_session
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        _shared_session = None
+
     @commands.Cog.listener()
     async def on_ready(self):
         logger.info(f"{self.__class__.__name__} cog has been loaded")
@@ -390,6 +593,45 @@ class FilterCheck(commands.Cog):
         message = f"```yaml\n{user_data.get('username', 'Unknown')} is ❌ DENIED ❌ [{reason}]\n```"
         await channel.send(content=message)
 
+    async def deny(self, interaction: discord.Interaction, user_data: dict, reason: str):
+        """Log a denied check and acknowledge it; the two Discord calls run concurrently."""
+        await asyncio.gather(
+            self.send_check_result(user_data, reason=reason, interaction=interaction),
+            interaction.edit_original_response(content="✅ Check completed and logged.")
+        )
+
+    @app_commands.command(name="cache_invalidate", description="Drop cached filter check data for a user.")
+    @app_commands.describe(user="Roblox username, Roblox ID or Discord ID to drop from the cache.")
+    async def cache_invalidate(self, interaction: discord.Interaction, user: str):
+        # Admin-only: the /check gate lets everyone in when no roles are configured
+        if not is_bot_owner(interaction.user.id):
+            await interaction.response.send_message(
+                "❌ Only bot owners can invalidate the filter check cache.",
+                ephemeral=True
+            )
+            return
+
+        key = user.strip().lower()
+        removed = 0
+        # Roblox IDs whose social counts go too, including ones matched by username
+        roblox_ids = set()
+        for cache_key, user_data in list(_roblox_user_cache.items()):
+            if cache_key == key or str(user_data["user_id"]) == key:
+                _roblox_user_cache.pop(cache_key, None)
+                roblox_ids.add(str(user_data["user_id"]))
+                removed += 1
+        if key.isdigit():
+            roblox_ids.add(key)
+            if _discord_user_cache.pop(int(key), None):
+                removed += 1
+        for cache_key in [k for k in _social_count_cache if str(k[0]) in roblox_ids]:
+            _social_count_cache.pop(cache_key, None)
+
+        await interaction.response.send_message(
+            f"🗑️ Removed {removed} cached entr{'y' if removed == 1 else 'ies'} for **{user}**.",
+            ephemeral=True
+        )
+
     @app_commands.command(name="check", description="Check a user's Roblox & Discord account information.")
     @app_commands.describe(
         roblox_username="The Roblox username to check.",
@@ -399,8 +641,8 @@ class FilterCheck(commands.Cog):
         if not await self.check_permissions(interaction):
             return
         
+        # The deferred "thinking..." state already shows the check is running
         await interaction.response.defer(ephemeral=True)
-        await interaction.edit_original_response(content="⏳ Processing the check...")
 
         try:
             discord_id_int = int(discord_id)
@@ -408,64 +650,57 @@ class FilterCheck(commands.Cog):
             await report_error(interaction, "Invalid Discord ID provided.", level="error")
             return
 
-        async with aiohttp.ClientSession() as session:
-            user_info = await fetch_discord_user_info(self.bot, discord_id_int, interaction)
+        session = await self.get_session()
+        # Discord, Roblox and Trello lookups are independent of each other.
+        # Whatever is still running when a deny decision is reached gets cancelled.
+        discord_task = asyncio.create_task(fetch_discord_user_info(self.bot, discord_id_int, interaction))
+        roblox_task = asyncio.create_task(fetch_roblox_user_data(session, roblox_username, interaction))
+        trello_task = asyncio.create_task(check_trello_blacklist(session, [roblox_username, str(discord_id_int)]))
+        pending = [discord_task, roblox_task, trello_task]
+
+        try:
+            user_info = await discord_task
             if not user_info:
                 return
 
             if user_info['account_age_days'] < config.FILTER_CHECK["min_discord_age_days"]:
-                await self.send_check_result(
-                    {"username": user_info['username']},
-                    reason="DISCORD ACCOUNT TOO YOUNG",
-                    interaction=interaction
-                )
-                await interaction.edit_original_response(content="✅ Check completed and logged.")
+                await self.deny(interaction, {"username": user_info['username']}, "DISCORD ACCOUNT TOO YOUNG")
                 return
 
-            user_data = await fetch_roblox_user_data(session, roblox_username, interaction)
+            user_data = await roblox_task
             if not user_data:
                 return
+            # Only needed for the final report; overlaps with the Trello wait
+            divisions_task = asyncio.create_task(get_user_divisions(session, user_data['user_id']))
+            pending.append(divisions_task)
+
+            blacklist_info = await trello_task
 
-            identifiers = [user_data['username'], str(discord_id_int)]
-            blacklist_info = await check_trello_blacklist(identifiers)
             major_blacklists = blacklist_info['major_blacklists'] if blacklist_info else []
             blacklists = blacklist_info['blacklists'] if blacklist_info else []
 
             if major_blacklists:
-                await self.send_check_result(
-                    user_data,
-                    reason=f"MAJOR BLACKLIST DETECTED: {', '.join(major_blacklists)}",
-                    interaction=interaction
-                )
-                await interaction.edit_original_response(content="✅ Check completed and logged.")
+                await self.deny(interaction, user_data, f"MAJOR BLACKLIST DETECTED: {', '.join(major_blacklists)}")
                 return
 
-            deny_blacklists = [bl for bl in blacklists if any(
-                deny_cat.lower() in bl.lower() for deny_cat in DENY_BLACKLIST_CATEGORIES)]
+            deny_blacklists = [bl for bl in blacklists if _DENY_PATTERN.search(bl)] if _DENY_PATTERN else []
             if deny_blacklists:
-                await self.send_check_result(
-                    user_data,
-                    reason=f"BLACKLIST DETECTED: {', '.join(deny_blacklists)}",
-                    interaction=interaction
-                )
-                await interaction.edit_original_response(content="✅ Check completed and logged.")
+                await self.deny(interaction, user_data, f"BLACKLIST DETECTED: {', '.join(deny_blacklists)}")
                 return
 
-            main_divisions, sub_divisions, main_group, intelligence_groups = await get_user_divisions(
-                session, user_data['user_id'])
-            badges, badge_count = await fetch_user_badges_with_count(session, user_data['user_id'])
+            # Badges were already paginated by fetch_roblox_user_data
+            badges, badge_count = user_data['badges'], user_data['badge_count']
 
             if badge_count < config.FILTER_CHECK["min_badge_count"]:
-                await self.send_check_result(
-                    user_data,
-                    reason=f"NOT ENOUGH BADGES DETECTED ({badge_count}/{config.FILTER_CHECK['min_badge_count']})",
-                    interaction=interaction
-                )
-                await interaction.edit_original_response(content="✅ Check completed and logged.")
+                await self.deny(interaction, user_data, f"NOT ENOUGH BADGES DETECTED ({badge_count}/{config.FILTER_CHECK['min_badge_count']})")
                 return
 
-            badge_graph = await generate_badge_growth_graph(
-                badges, user_data['account_created__date'], user_data['username'], user_data['user_id'])
+            # Every deny gate has passed, so the graph is worth rendering now
+            (main_divisions, sub_divisions, main_group, intelligence_groups), badge_graph = await asyncio.gather(
+                divisions_task,
+                generate_badge_growth_graph(
+                    badges, user_data['account_created__date'], user_data['username'], user_data['user_id'])
+            )
 
             major_str = ", ".join(major_blacklists) if major_blacklists else "Clear"
             blacklist_str = ", ".join(blacklists) if blacklists else "Clear"
@@ -506,6 +741,10 @@ class FilterCheck(commands.Cog):
 
             await interaction.edit_original_response(content="✅ Check completed and logged.")
 
+        finally:
+            for task in pending:
+                if not task.done():
+                    task.cancel()
 
 async def setup(bot):
     await bot.add_cog(FilterCheck(bot))
\ No newline at end of file
@@ -1,55 +1,124 @@
 import discord
-import json
+import asyncio
+import orjson
 import os
+import threading
 import aiohttp
-from discord.ext import commands
+import logging
+from discord.ext import commands, tasks
 from discord import app_commands
 
 # Import helper functions cleanly
 from config import (
-    has_permission,
     is_bot_owner,
-    is_server_allowed
+    is_server_allowed,
+    has_permission
 )
 import config
 
+logger = logging.getLogger(__name__)
 
-# ------------------ JSON DATA HANDLING ------------------
-def load_data():
-    file = config.INVITE["data_file"]
-    if not os.path.exists(file):
-        return {"requested": []}
 
-    with open(file, "r") as f:
-        return json.load(f)
+# ------------------ SETTINGS ------------------
+# Bound once at import so the handlers don't repeat config.INVITE lookups
+_INV = config.INVITE
+DATA_FILE = _INV["data_file"]
+CONTROL_SERVERS = frozenset(_INV["control_servers"])
+ADMIN_ROLE_IDS = frozenset(_INV["admin_roles"])
+REQUIRED_ROLE_ID = _INV["required_role_id"]
+TARGET_GUILD_ID = _INV["target_guild_id"]
+TARGET_CHANNEL_ID = _INV["target_channel_id"]
+WEBHOOK_URL = _INV.get("log_webhook_url")
+
+# Webhook logs are joined into one post of up to LOG_BATCH_CHARS
+# (Discord allows 2000), waiting at most LOG_BATCH_WINDOW seconds for more
+LOG_BATCH_CHARS = 1900
+LOG_BATCH_WINDOW = 0.25
+# Seconds cog_unload waits for queued logs to be posted
+LOG_DRAIN_TIMEOUT = 5
 
+# Retries for a webhook post that hit a 429, a 5xx or a network error
+WEBHOOK_MAX_RETRIES = 3
+WEBHOOK_TIMEOUT = 10
 
-def save_data(data):
-    with open(config.INVITE["data_file"], "w") as f:
-        json.dump(data, f, indent=4)
+# Admin commands are registered only where is_server_allowed would accept
+# them (control + test servers), so Discord never routes them elsewhere
+COMMAND_GUILDS = [discord.Object(id=g) for g in config.INVITE_COMMAND_GUILD_IDS]
 
 
-data = load_data()
+def control_guild_command(func):
+    # No control servers configured means "all servers": keep it global
+    if not COMMAND_GUILDS:
+        return func
+    return app_commands.guilds(*COMMAND_GUILDS)(func)
 
 
-# ------------------ WEBHOOK LOGGING ------------------
-async def log_to_webhook(message: str):
-    webhook_url = config.INVITE.get("log_webhook_url")
-    if not webhook_url:
-        return
-    try:
-        async with aiohttp.ClientSession() as session:
-            resp = await session.post(webhook_url, json={"content": message})
-            print(f"Webhook response: {resp.status}")
-    except Exception as e:
-        print(f"Webhook failed: {e}")
+# ------------------ JSON DATA HANDLING ------------------
+def load_data():
+    # "requested" is kept as a set in memory for O(1) lookups
+    if not os.path.isfile(DATA_FILE):
+        return {"requested": set()}
+
+    with open(DATA_FILE, "rb") as f:
+        loaded = orjson.loads(f.read())
+    loaded["requested"] = set(loaded.get("requested", []))
+    return loaded
+
+
+# Held in the writer thread itself: cancelling a flush doesn't stop its
+# thread, so an event-loop lock would let the unload flush reuse the .tmp file
+_write_lock = threading.Lock()
+
+
+def _write_data(snapshot: dict):
+    # Write beside the real file and rename over it, so a crash mid-write
+    # can never leave a truncated data file behind
+    tmp = DATA_FILE + ".tmp"
+    with _write_lock:
+        with open(tmp, "wb") as f:
+            # orjson output is already compact (no indentation or padding)
+            f.write(orjson.dumps(snapshot, option=orjson.OPT_SORT_KEYS))
+        os.replace(tmp, DATA_FILE)
+
+
+async def save_data(data):
+    # Snapshot on the event loop so the set can't change mid-dump,
+    # then do the blocking file write in a worker thread
+    snapshot = {**data, "requested": sorted(data["requested"])}
+    await asyncio.to_thread(_write_data, snapshot)
+
+
+# ------------------ MESSAGES ------------------
+# Sent to the user after a successful request; only the invite URL varies
+DM_TEMPLATE = (
+    "# **Congratulations on passing the CG Academy!** 🎉\n"
+    "### You must now do the following:\n"
+    "• Request to join the Coruscant Guard Roblox group\n"
+    "• Join the Coruscant Guard Discord Server → {invite_url}\n"
+    "• & Fill out the verification format in https://discord.com/channels/1269671417192910860/1352349414546604133\n"
+    "• & Change your server name to [TRN] | username | timezone\n"
+    "• Join the Republic Security Forces Discord → https://discord.gg/WfenhZ7P\n"
+    "• & Fill out the verification format in https://discord.com/channels/1343041443316502590/1343044438213001307\n"
+    "• & Change your server name to [TRN] | username | timezone\n"
+    "• Leave the PEACEKEEPER ACADEMY Discord\n"
+    "• Wait patiently to be accepted.\n"
+)
+
+# Body of the static invite panel posted by /sendinvitepanel
+_PANEL_DESCRIPTION = (
+    "**Click the button to receive:**\n"
+    "• A **one-time use** invite link\n"
+    "• Information on what you must do next\n\n"
+    "If you do not receive a DM, contact <@433328712532885504>."
+)
 
 
 # ------------------ INVITE BUTTON ------------------
 class InviteButton(discord.ui.View):
-    def __init__(self, bot):
+    def __init__(self, bot, cog):
         super().__init__(timeout=None)
         self.bot = bot
+        self.cog = cog
 
     @discord.ui.button(
         label="Get Invite",
@@ -62,7 +131,7 @@ class InviteButton(discord.ui.View):
             user_id = user.id
 
             # Ensure button is only usable in a control server
-            if not is_server_allowed(interaction.guild_id, config.INVITE["control_servers"]):
+            if not is_server_allowed(interaction.guild_id, CONTROL_SERVERS):
                 return await interaction.response.send_message(
                     "❌ This button cannot be used here.",
                     ephemeral=True
@@ -75,7 +144,7 @@ class InviteButton(discord.ui.View):
                 # required_role = interaction.guild.get_role(
                 #     config.INVITE["required_role_id"])
                 # if required_role is None or required_role not in user.roles:
-                #     await log_to_webhook(
+                #     self.cog.log_to_webhook(
                 #         f"⚠️ User {user} ({user.id}) tried to request an invite, "
                 #         f"but required role {config.INVITE['required_role_id']} not found or missing."
                 #     )
@@ -84,13 +153,14 @@ class InviteButton(discord.ui.View):
                 #         ephemeral=True
                 #     )
 
-                required_role_id = config.INVITE["required_role_id"]
-                member = await interaction.guild.fetch_member(user.id)
-                if required_role_id not in [role.id for role in member.roles]:
-                    await log_to_webhook(
+                # interaction.user is the Member resolved with this interaction,
+                # so its roles are current without a fetch_member round trip;
+                # get_role is a bisect probe of the member's sorted role IDs
+                if user.get_role(REQUIRED_ROLE_ID) is None:
+                    self.cog.log_to_webhook(
                         f"⚠️ User {user} ({user.id}) tried to request an invite, "
-                        f"but required role {required_role_id} not found or missing. "
-                        f"User roles: {[r.id for r in member.roles]}"
+                        f"but required role {REQUIRED_ROLE_ID} not found or missing. "
+                        f"User roles: {list(user._roles)}"
                     )
                     return await interaction.response.send_message(
                         "❌ You do not have the required role to request an invite.",
@@ -98,26 +168,21 @@ class InviteButton(discord.ui.View):
                     )
 
                 # Prevent duplicate invite
-                if user_id in data["requested"]:
+                if user_id in self.cog.data["requested"]:
                     return await interaction.response.send_message(
                         "❌ You already received an invite.",
                         ephemeral=True
                     )
 
-            # Create invite from target guild
-            target_guild = self.bot.get_guild(config.INVITE["target_guild_id"])
-            if target_guild is None:
-                await log_to_webhook(f"❌ Target guild {config.INVITE['target_guild_id']} not found for {interaction.user} ({interaction.user.id}).")
-                return await interaction.response.send_message(
-                    "⚠️ Something went wrong. Please contact the bot owner.",
-                    ephemeral=True
-                )
+            # The checks above answer instantly; everything below is Discord
+            # round trips, so ACK now instead of racing the 3-second deadline
+            await interaction.response.defer(ephemeral=True, thinking=True)
 
-            target_channel = target_guild.get_channel(
-                config.INVITE["target_channel_id"])
+            # Create invite from target guild
+            target_channel = self.cog.get_target_channel()
             if target_channel is None:
-                await log_to_webhook(f"❌ Target channel {config.INVITE['target_channel_id']} not found in guild {target_guild.id} for {interaction.user} ({interaction.user.id}).")
-                return await interaction.response.send_message(
+                self.cog.log_to_webhook(f"❌ Target channel {TARGET_CHANNEL_ID} in guild {TARGET_GUILD_ID} not found for {interaction.user} ({interaction.user.id}).")
+                return await interaction.followup.send(
                     "⚠️ Something went wrong. Please contact the bot owner.",
                     ephemeral=True
                 )
@@ -128,136 +193,263 @@ class InviteButton(discord.ui.View):
                     unique=True
                 )
             except Exception as e:
-                await log_to_webhook(f"❌ Failed to create invite for {user} ({user_id}): {e}")
-                return await interaction.response.send_message(
+                self.cog.log_to_webhook(f"❌ Failed to create invite for {user} ({user_id}): {e}")
+                return await interaction.followup.send(
                     "⚠️ Something went wrong. Please contact the bot owner.",
                     ephemeral=True
                 )
 
             # Track user unless they’re an owner
             if not is_bot_owner(user_id):
-                try:
-                    data["requested"].append(user_id)
-                    save_data(data)
-                except Exception as e:
-                    await log_to_webhook(f"❌ Failed to save data for {user} ({user_id}): {e}")
-                    return await interaction.response.send_message(
-                        "⚠️ Something went wrong. Please contact the bot owner.",
-                        ephemeral=True
-                    )
+                self.cog.data["requested"].add(user_id)
+                self.cog.mark_dirty()
 
-            await log_to_webhook(
-                f"🎟️ **{user}** (ID: {user_id}) requested an invite."
-            )
+            self.cog.log_to_webhook(f"🎟️ **{user}** (ID: {user_id}) requested an invite.")
 
             # Try sending DM
             try:
-                await user.send(
-                    f"# **Congratulations on passing the CG Academy!** 🎉\n"
-                    f"### You must now do the following:\n"
-                    f"• Request to join the Coruscant Guard Roblox group\n"
-                    f"• Join the Coruscant Guard Discord Server → {invite.url}\n"
-                    f"• & Fill out the verification format in https://discord.com/channels/1269671417192910860/1352349414546604133\n"
-                    f"• & Change your server name to [TRN] | username | timezone\n"
-                    f"• Join the Republic Security Forces Discord → https://discord.gg/WfenhZ7P\n"
-                    f"• & Fill out the verification format in https://discord.com/channels/1343041443316502590/1343044438213001307\n"
-                    f"• & Change your server name to [TRN] | username | timezone\n"
-                    f"• Leave the PEACEKEEPER ACADEMY Discord\n"
-                    f"• Wait patiently to be accepted.\n"
-                )
+                await user.send(DM_TEMPLATE.format(invite_url=invite.url))
             except discord.Forbidden:
-                return await interaction.response.send_message(
+                return await interaction.followup.send(
                     "⚠️ I could not DM you. Please enable DMs.",
                     ephemeral=True
                 )
 
             # Log success
-            try:
-                await log_to_webhook(f"🎟️ {user} ({user_id}) requested an invite")
-            except Exception:
-                pass  # Do not fail interaction if logging fails
+            self.cog.log_to_webhook(f"🎟️ {user} ({user_id}) requested an invite")
 
-            return await interaction.response.send_message(
+            return await interaction.followup.send(
                 "📩 Check your DMs! I've sent your invite.",
                 ephemeral=True
             )
 
         except Exception as e:
-            await log_to_webhook(f"❌ Unexpected error in get_invite for {user} ({user_id}): {e}")
+            self.cog.log_to_webhook(f"❌ Unexpected error in get_invite for {user} ({user_id}): {e}")
+            # The response may already have been deferred
+            if interaction.response.is_done():
+                return await interaction.followup.send(
+                    "⚠️ Something went wrong. Please contact the bot owner.",
+                    ephemeral=True
+                )
             return await interaction.response.send_message(
                 "⚠️ Something went wrong. Please contact the bot owner.",
                 ephemeral=True
             )
 
 
+# ------------------ ADMIN CHECK ------------------
+async def is_invite_admin(interaction: discord.Interaction) -> bool:
+    """app_commands check: admin role (or bot owner)"""
+    # The guild restriction is handled by control_guild_command at registration;
+    # Member._roles is the SnowflakeList has_permission probes directly
+    if not has_permission(interaction.user.id, interaction.user._roles, ADMIN_ROLE_IDS):
+        raise app_commands.CheckFailure("❌ You don't have permission to use this command.")
+
+    return True
+
+
 # ------------------ MAIN COG ------------------
 class InviteCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.bot.add_view(InviteButton(self.bot))
+        # Shared through the bot so extension reloads keep the in-memory copy
+        self.data = bot.invite_state
+        self.session: aiohttp.ClientSession | None = None
+        self._dirty = False
+        self._target_channel = None
+        # Bounded so a webhook outage can't grow memory without limit
+        # (None is the shutdown sentinel used by _drain_logs)
+        self._log_queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=1024)
+        self._log_worker_task: asyncio.Task | None = None
+        # One persistent view handles every panel's button via its custom_id
+        self._view = InviteButton(self.bot, self)
+        self.bot.add_view(self._view)
+
+    async def cog_load(self):
+        # Pooled connections and cached DNS keep webhook posts off the handshake path
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=WEBHOOK_TIMEOUT)
+        )
+        # The panel never changes, so build it once and resend the same embed
+        self._panel_embed = discord.Embed(
+            title="Request Invite",
+            description=_PANEL_DESCRIPTION,
+            color=0xFFFFFF
+        )
+        self._flush_task.start()
+        self._log_worker_task = asyncio.create_task(self._log_worker())
+
+    async def cog_unload(self):
+        self._flush_task.cancel()
+        if self._log_worker_task:
+            await self._drain_logs()
+        await self.flush_data()
+        if self.session:
+            await self.session.close()
+
+    def get_target_channel(self):
+        """Resolve the invite channel once and reuse it until it is invalidated"""
+        if self._target_channel is None:
+            target_guild = self.bot.get_guild(TARGET_GUILD_ID)
+            if target_guild is not None:
+                self._target_channel = target_guild.get_channel(TARGET_CHANNEL_ID)
+        return self._target_channel
 
-    async def check_admin_permissions(self, interaction: discord.Interaction) -> bool:
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Guild caches are rebuilt on (re)connect
+        self._target_channel = None
 
-        # Must be in control server
-        if not is_server_allowed(interaction.guild_id, config.INVITE["control_servers"]):
-            await interaction.response.send_message(
-                "❌ This command can only be used in control servers.",
-                ephemeral=True
-            )
-            return False
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        if channel.id == TARGET_CHANNEL_ID:
+            self._target_channel = None
+
+    # ------------------ DATA PERSISTENCE ------------------
+    def mark_dirty(self):
+        """Schedule the invite data to be written on the next flush"""
+        self._dirty = True
+
+    async def flush_data(self):
+        """Write the invite data to disk if it changed since the last flush"""
+        if not self._dirty:
+            return
+        # Cleared up front so changes made during the write are flushed next time
+        self._dirty = False
+        try:
+            await save_data(self.data)
+        except Exception as e:
+            self._dirty = True
+            print(f"Failed to save invite data: {e}")
 
-        # Check roles permissions
-        user_roles = [role.id for role in interaction.user.roles]
-        allowed_roles = config.INVITE["admin_roles"]
+    @tasks.loop(seconds=30)
+    async def _flush_task(self):
+        await self.flush_data()
 
-        if not has_permission(interaction.user.id, user_roles, allowed_roles):
-            await interaction.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return False
+    # ------------------ WEBHOOK LOGGING ------------------
+    def log_to_webhook(self, message: str):
+        """Queue a message for the webhook worker; never blocks the caller"""
+        if not WEBHOOK_URL:
+            return
+        try:
+            self._log_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            print(f"Webhook queue full, dropping log: {message}")
+
+    async def _drain_logs(self):
+        """Post whatever is still queued, then stop the worker"""
+        try:
+            # None tells the worker to send its last batch and exit
+            self._log_queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass  # Worker gets cancelled after the timeout instead
+        try:
+            await asyncio.wait_for(self._log_worker_task, timeout=LOG_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"Webhook queue not drained in {LOG_DRAIN_TIMEOUT}s, dropping {self._log_queue.qsize()} logs")
+
+    async def _log_worker(self):
+        pending = None
+        stopping = False
+        while not stopping:
+            # Start a batch with the message that didn't fit last time, if any
+            first = pending if pending is not None else await self._log_queue.get()
+            pending = None
+            if first is None:
+                return
+            batch = [first]
+            size = len(first)
+
+            # Collect whatever arrives within the window into the same post
+            while size < LOG_BATCH_CHARS:
+                try:
+                    message = await asyncio.wait_for(self._log_queue.get(), timeout=LOG_BATCH_WINDOW)
+                except asyncio.TimeoutError:
+                    break
+                if message is None:
+                    # Unloading: post this batch, then stop
+                    stopping = True
+                    break
+                if size + 1 + len(message) > LOG_BATCH_CHARS:
+                    pending = message
+                    break
+                batch.append(message)
+                size += 1 + len(message)
+
+            await self._post_webhook("\n".join(batch)[:2000], len(batch))
+
+    async def _post_webhook(self, content: str, count: int):
+        """Post one batch, retrying 429s and 5xx responses with backoff"""
+        for attempt in range(WEBHOOK_MAX_RETRIES + 1):
+            delay = 2 ** attempt
+            try:
+                async with self.session.post(WEBHOOK_URL, json={"content": content}) as resp:
+                    print(f"Webhook response: {resp.status} ({count} messages)")
+                    if resp.status != 429 and resp.status < 500:
+                        return
+                    # Discord says how long to wait when rate limiting
+                    retry_after = resp.headers.get("Retry-After") or resp.headers.get("X-RateLimit-Reset-After")
+                    if retry_after:
+                        delay = float(retry_after)
+            except Exception as e:
+                print(f"Webhook failed: {e}")
+
+            if attempt < WEBHOOK_MAX_RETRIES:
+                await asyncio.sleep(delay)
+
+        print(f"Webhook gave up after {WEBHOOK_MAX_RETRIES + 1} attempts")
 
-        return True
+    async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        # Admin check failures carry the message to show the user
+        if isinstance(error, app_commands.CheckFailure):
+            message = str(error)
+        else:
+            # Defining this handler stops the tree from logging, so log here
+            command = interaction.command.name if interaction.command else "?"
+            logger.error(f"Ignoring exception in command /{command}", exc_info=error)
+            message = "⚠️ Something went wrong. Please contact the bot owner."
+
+        try:
+            if interaction.response.is_done():
+                await interaction.followup.send(message, ephemeral=True)
+            else:
+                await interaction.response.send_message(message, ephemeral=True)
+        except discord.HTTPException as e:
+            logger.error(f"Failed to send command error reply: {e}")
 
     # ---------------------------------------------------------
     @app_commands.command(name="sendinvitepanel", description="Send the permanent invite panel.")
+    @control_guild_command
+    @app_commands.check(is_invite_admin)
     async def sendinvitepanel(self, interaction: discord.Interaction):
-        if not await self.check_admin_permissions(interaction):
-            return
-
-        embed = discord.Embed(
-            title="Request Invite",
-            description=(
-                "**Click the button to receive:**\n"
-                "• A **one-time use** invite link\n"
-                "• Information on what you must do next\n\n"
-                "If you do not receive a DM, contact <@433328712532885504>."
-            ),
-            color=0xFFFFFF
-        )
-
         await interaction.response.send_message(
-            embed=embed,
-            view=InviteButton(self.bot)
+            embed=self._panel_embed,
+            view=self._view
         )
 
     # ---------------------------------------------------------
     @app_commands.command(name="resetinvite", description="Reset a user's invite eligibility.")
+    @control_guild_command
     @app_commands.describe(user="User to reset")
+    @app_commands.check(is_invite_admin)
     async def resetinvite(self, interaction: discord.Interaction, user: discord.User):
-        if not await self.check_admin_permissions(interaction):
-            return
-
         uid = user.id
 
-        if uid in data["requested"]:
-            data["requested"].remove(uid)
-            save_data(data)
+        if uid in self.data["requested"]:
+            self.data["requested"].remove(uid)
+            self.mark_dirty()
 
             await interaction.response.send_message(
                 f"✅ Reset invite eligibility for **{user}**."
             )
-            await log_to_webhook(
+            self.log_to_webhook(
                 f"🔄 Eligibility reset for {user} by {interaction.user}."
             )
         else:
@@ -270,19 +462,24 @@ class InviteCog(commands.Cog):
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
         """Automatically remove users from invite tracking when they leave"""
-        if not is_server_allowed(member.guild.id, config.INVITE["control_servers"]):
-            return
-
         uid = member.id
 
-        if uid in data["requested"]:
-            data["requested"].remove(uid)
-            save_data(data)
+        # Most leaves are untracked users; bail out before the guild check
+        if uid not in self.data["requested"]:
+            return
+        if not is_server_allowed(member.guild.id, CONTROL_SERVERS):
+            return
 
-            await log_to_webhook(
-                f"🚪 **{member}** (ID: {uid}) left a control server – removed from invite list."
-            )
+        self.data["requested"].remove(uid)
+        self.mark_dirty()
+
+        self.log_to_webhook(
+            f"🚪 **{member}** (ID: {uid}) left a control server – removed from invite list."
+        )
 
 
 async def setup(bot):
+    # Only read the file on first load, not on every reload
+    if not hasattr(bot, "invite_state"):
+        bot.invite_state = load_data()
     await bot.add_cog(InviteCog(bot))
@@ -2,81 +2,223 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from discord.ext import tasks
-from datetime import datetime, time
+from datetime import datetime, time, timedelta, timezone
 import gspread
+from gspread.utils import a1_to_rowcol, rowcol_to_a1
 from oauth2client.service_account import ServiceAccountCredentials
 import asyncio
+import contextlib
 import os
+import random
 import logging
+from time import monotonic
 
-import config
 from config import is_server_allowed, has_permission, is_bot_owner
+from config import (
+    STAFF_RATING_SPREADSHEET_URL,
+    STAFF_RATING_CREDENTIALS,
+    STAFF_RATING_SERVERS,
+    STAFF_RATING_ADMIN_ROLES,
+    STAFF_RATING_REACTIONS,
+    STAFF_RATING_CACHE_TTL
+)
 
 logger = logging.getLogger(__name__)
 
+# gspread APIError statuses worth retrying (quota and transient server errors)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Gateway member queries in flight at once when the index misses a holder
+MEMBER_QUERY_CONCURRENCY = 5
+
+# Weekly auto-post slot: weekday (Monday = 0) and time of day, in UTC.
+# Always compare against aware UTC datetimes, never naive local time
+AUTO_POST_WEEKDAY = 6
+AUTO_POST_TIME = time(hour=21, minute=0, tzinfo=timezone.utc)
+
+# Guilds auto-posted to at once; each has its own channel rate limits
+AUTO_POST_CONCURRENCY = 4
+
+def next_auto_post(now: datetime) -> datetime:
+    """The first auto-post slot strictly after now (an aware datetime)"""
+    run = datetime.combine(now.date(), AUTO_POST_TIME)
+    run += timedelta(days=(AUTO_POST_WEEKDAY - now.weekday()) % 7)
+    if run <= now:
+        run += timedelta(days=7)
+    return run
+
+
+class Header:
+    """Section header line in the rating post"""
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        self.text = text
+
+
+class Cell:
+    """Position whose holder is read from a sheet cell"""
+    __slots__ = ("sheet", "cell", "title")
+
+    def __init__(self, sheet, cell, title):
+        self.sheet = sheet
+        self.cell = cell
+        self.title = title
+
+
+# Post layout, in order: section headers and the positions under them
+POSITIONS = (
+    # Section header
+    Header("▬▬▬▬▬ Coruscant Guard High Command ▬▬▬▬▬"),
+    # High Command (from Info2 sheet)
+    Cell("Info2", "E14:F14", "**Commander Fox**"),
+    Cell("Info2", "E15:F15", "**Commander Thorn**"),
+    Cell("Info2", "E16:F16", "**Commander Stone**"),
+    Cell("Info2", "E17:F17", "**Lieutenant Thire**"),
+
+    # Section header
+    Header("▬▬▬▬▬ Instructor Command ▬▬▬▬▬"),
+    # Instructor Command
+    Cell("Officers", "F40", "**Instructor Department Commander**"),
+    Cell("Officers", "F33", "**Instructor Department Executive**"),
+    Cell("Officers", "F21", "**Instructor Department Lead Sergeant**"),
+    Cell("Officers", "F22", "**Instructor Department Sergeant**"),
+    Cell("Officers", "F23", "**Instructor Department Sergeant**"),
+
+    # Section header
+    Header("▬▬▬▬▬ Advanced Recon Commando Command ▬▬▬▬▬"),
+    # ARC
+    Cell("Officers", "F39", "**ARC Company Commander**"),
+    Cell("Officers", "F34", "**ARC Company Executive**"),
+    Cell("Officers", "F24", "**ARC Company Sergeant**"),
+    Cell("Officers", "F25", "**ARC Company Sergeant**"),
+
+    # Section header
+    Header("▬▬▬▬▬ Hound Company Command ▬▬▬▬▬"),
+    # Hound Company
+    Cell("Officers", "F41", "**Hound Company Commander**"),
+    Cell("Officers", "F30", "**Hound Company Executive**"),
+    Cell("Officers", "F12", "**Hound Company Sergeant**"),
+    Cell("Officers", "F13", "**Hound Company Sergeant**"),
+    Cell("Officers", "F14", "**Hound Company Sergeant**"),
+
+    # Section header
+    Header("▬▬▬▬▬ Riot Company Command ▬▬▬▬▬"),
+    # Riot Company
+    Cell("Officers", "F42", "**Riot Company Commander**"),
+    Cell("Officers", "F31", "**Riot Company Executive**"),
+    Cell("Officers", "F15", "**Riot Company Sergeant**"),
+    Cell("Officers", "F16", "**Riot Company Sergeant**"),
+    Cell("Officers", "F17", "**Riot Company Sergeant**"),
+
+    # Section header
+    Header("▬▬▬▬▬ Shock Company Command ▬▬▬▬▬"),
+    # Shock Company
+    Cell("Officers", "F43", "**Shock Company Commander**"),
+    Cell("Officers", "F32", "**Shock Company Executive**"),
+    Cell("Officers", "F18", "**Shock Company Sergeant**"),
+    Cell("Officers", "F19", "**Shock Company Sergeant**"),
+    Cell("Officers", "F20", "**Shock Company Sergeant**"),
+)
+
+
+
+def _sheet_ranges(cells):
+    """
+    One bounding A1 range per sheet covering all of its cells, plus where
+    each (sheet, cell) lands in the returned grid: (range index, row, col).
+    Merged cells (e.g. E14:F14) are located by their first cell.
+    """
+    by_sheet = {}
+    for item in cells:
+        row, col = a1_to_rowcol(item.cell.split(":")[0])
+        by_sheet.setdefault(item.sheet, []).append((item, row, col))
+
+    ranges = []
+    offsets = {}
+    for sheet, entries in by_sheet.items():
+        top = min(row for _, row, _ in entries)
+        left = min(col for _, _, col in entries)
+        bottom = max(row for _, row, _ in entries)
+        right = max(col for _, _, col in entries)
+        for item, row, col in entries:
+            offsets[item.sheet, item.cell] = (len(ranges), row - top, col - left)
+        ranges.append(f"'{sheet}'!{rowcol_to_a1(top, left)}:{rowcol_to_a1(bottom, right)}")
+    return tuple(ranges), offsets
+
+
+# Only the cell entries, in POSITIONS order, and the per-sheet ranges for the batch read
+_CELL_POSITIONS = tuple(item for item in POSITIONS if isinstance(item, Cell))
+_RANGES, _CELL_OFFSETS = _sheet_ranges(_CELL_POSITIONS)
+
+
+class MemberIndex:
+    """
+    Username lookups over one guild's members.
+    Display names follow format: [RANK] | username | timezone, so each
+    "|"-separated part is indexed as a token; the lowercased full names
+    are kept for the substring fallback.
+    """
+
+    def __init__(self, members=()):
+        self.tokens: dict[str, discord.Member] = {}
+        self.names: dict[int, tuple[discord.Member, str]] = {}
+        for member in members:
+            self.add(member)
+
+    @staticmethod
+    def _split(display_name):
+        return [token.strip() for token in display_name.split("|") if token.strip()]
+
+    def add(self, member):
+        display_name = member.display_name.lower()
+        self.names[member.id] = (member, display_name)
+        for token in self._split(display_name):
+            self.tokens.setdefault(token, member)
+
+    def remove(self, member):
+        entry = self.names.pop(member.id, None)
+        if entry is None:
+            return
+        for token in self._split(entry[1]):
+            if self.tokens.get(token) is not None and self.tokens[token].id == member.id:
+                del self.tokens[token]
+
+    def find(self, username):
+        username = username.lower().strip()
+
+        # Exact username token first, then any display name containing it
+        member = self.tokens.get(username)
+        if member:
+            return member
+        for member, display_name in self.names.values():
+            if username in display_name:
+                return member
+
+        return None
+
 
 class StaffRatingCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        # One authorized client per process; gspread's session refreshes
+        # the access token by itself, so it is never re-authorized
         self.client = None
         self.setup_sheets_client()
 
-        # Position structure with sheet names and cells
-        # Headers: ("header", "Header Text")
-        # Positions: (sheet_name, cell_address, position_title)
-        self.POSITIONS = [
-            # Section header
-            ("header", "▬▬▬▬▬ Coruscant Guard High Command ▬▬▬▬▬"),
-            # High Command (from Info2 sheet)
-            ("Info2", "E14:F14", "**Commander Fox**"),
-            ("Info2", "E15:F15", "**Commander Thorn**"),
-            ("Info2", "E16:F16", "**Commander Stone**"),
-            ("Info2", "E17:F17", "**Lieutenant Thire**"),
-
-            # Section header
-            ("header", "▬▬▬▬▬ Instructor Command ▬▬▬▬▬"),
-            # Instructor Command
-            ("Officers", "F40", "**Instructor Department Commander**"),
-            ("Officers", "F33", "**Instructor Department Executive**"),
-            ("Officers", "F21", "**Instructor Department Lead Sergeant**"),
-            ("Officers", "F22", "**Instructor Department Sergeant**"),
-            ("Officers", "F23", "**Instructor Department Sergeant**"),
-
-            # Section header
-            ("header", "▬▬▬▬▬ Advanced Recon Commando Command ▬▬▬▬▬"),
-            # ARC
-            ("Officers", "F39", "**ARC Company Commander**"),
-            ("Officers", "F34", "**ARC Company Executive**"),
-            ("Officers", "F24", "**ARC Company Sergeant**"),
-            ("Officers", "F25", "**ARC Company Sergeant**"),
-
-            # Section header
-            ("header", "▬▬▬▬▬ Hound Company Command ▬▬▬▬▬"),
-            # Hound Company
-            ("Officers", "F41", "**Hound Company Commander**"),
-            ("Officers", "F30", "**Hound Company Executive**"),
-            ("Officers", "F12", "**Hound Company Sergeant**"),
-            ("Officers", "F13", "**Hound Company Sergeant**"),
-            ("Officers", "F14", "**Hound Company Sergeant**"),
-
-            # Section header
-            ("header", "▬▬▬▬▬ Riot Company Command ▬▬▬▬▬"),
-            # Riot Company
-            ("Officers", "F42", "**Riot Company Commander**"),
-            ("Officers", "F31", "**Riot Company Executive**"),
-            ("Officers", "F15", "**Riot Company Sergeant**"),
-            ("Officers", "F16", "**Riot Company Sergeant**"),
-            ("Officers", "F17", "**Riot Company Sergeant**"),
-
-            # Section header
-            ("header", "▬▬▬▬▬ Shock Company Command ▬▬▬▬▬"),
-            # Shock Company
-            ("Officers", "F43", "**Shock Company Commander**"),
-            ("Officers", "F32", "**Shock Company Executive**"),
-            ("Officers", "F18", "**Shock Company Sergeant**"),
-            ("Officers", "F19", "**Shock Company Sergeant**"),
-            ("Officers", "F20", "**Shock Company Sergeant**"),
-        ]
+        # Opened spreadsheet reused across commands; dropped on lookup or auth errors
+        self._spreadsheet: gspread.Spreadsheet | None = None
+        self._spreadsheet_url = None
+
+        # sheet URL -> (fetched_at, holders) so preview/post/auto-post share reads
+        self._cache: dict[str, tuple[float, dict]] = {}
+        self._cache_lock = asyncio.Lock()
+
+        # Slot of the most recent auto-post run
+        self._last_auto_post = datetime.min.replace(tzinfo=timezone.utc)
+
+        # guild ID -> MemberIndex, kept current by the member listeners
+        self._member_indexes: dict[int, MemberIndex] = {}
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -90,8 +232,7 @@ class StaffRatingCog(commands.Cog):
         """Initialize Google Sheets API client"""
         try:
             # Get credentials path from config
-            creds_file = config.STAFF_RATING.get(
-                'credentials_file', 'credentials.json')
+            creds_file = STAFF_RATING_CREDENTIALS
 
             # Get the directory where this file is located
             current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -125,14 +266,29 @@ class StaffRatingCog(commands.Cog):
             logger.error(
                 f"Failed to initialize Sheets client: {e}", exc_info=True)
 
+    def _open_spreadsheet(self, sheet_url):
+        """Blocking: the spreadsheet handle, opened with the client on first use"""
+        client = self.client
+        if client is None:
+            raise RuntimeError("Google Sheets client is not initialized")
+        if self._spreadsheet is None or self._spreadsheet_url != sheet_url:
+            self._spreadsheet = client.open_by_url(sheet_url)
+            self._spreadsheet_url = sheet_url
+        return self._spreadsheet
+
+    def _drop_spreadsheet(self):
+        """Forget the cached handle so the next read opens the sheet again"""
+        self._spreadsheet = None
+        self._spreadsheet_url = None
+
     async def check_permissions(self, interaction: discord.Interaction) -> bool:
         """Check if user has permission to use staff rating commands"""
-        user_role_ids = [role.id for role in interaction.user.roles]
-
+        # Member._roles is the SnowflakeList of role IDs discord.py already
+        # keeps; passing it avoids building Role objects and an ID list
         if not has_permission(
             interaction.user.id,
-            user_role_ids,
-            config.STAFF_RATING.get('admin_roles', [])
+            interaction.user._roles,
+            STAFF_RATING_ADMIN_ROLES
         ):
             await interaction.response.send_message(
                 "❌ You don't have permission to use this command.",
@@ -144,46 +300,221 @@ class StaffRatingCog(commands.Cog):
 
     def get_rating_channel(self, guild_id: int):
         """Get the rating channel ID for a specific guild"""
-        servers = config.STAFF_RATING.get('servers', {})
-        server_config = servers.get(guild_id, {})
+        server_config = STAFF_RATING_SERVERS.get(guild_id, {})
         return server_config.get('rating_channel_id')
 
-    def find_member_by_username(self, guild, username):
-        """
-        Search for a Discord member whose display name contains the username.
-        Display names follow format: [RANK] | username | timezone
-        """
+    def get_member_index(self, guild):
+        """Return the guild's MemberIndex, building it from guild.members on first use"""
+        index = self._member_indexes.get(guild.id)
+        if index is None:
+            index = self._member_indexes[guild.id] = MemberIndex(guild.members)
+        return index
+
+    def find_member_by_username(self, member_index, username):
+        """Find the member for a sheet username using a MemberIndex"""
         if username == "N/A" or not username:
             return None
+        return member_index.find(username)
 
-        # Search through all members
-        for member in guild.members:
-            # Check if username is in their display name (case-insensitive)
-            if username.lower() in member.display_name.lower():
-                return member
+    async def resolve_holders(self, guild, holders):
+        """
+        Map each distinct sheet holder to a member for this run. Holders the
+        index can't place are looked up with guild.query_members, in case the
+        member cache is incomplete; members found that way are indexed too.
+        """
+        index = self.get_member_index(guild)
+        members = {}
+        missing = []
+        for holder in set(holders.values()):
+            member = self.find_member_by_username(index, holder)
+            if member:
+                members[holder] = member
+            elif holder != "N/A":
+                missing.append(holder)
+
+        semaphore = asyncio.Semaphore(MEMBER_QUERY_CONCURRENCY)
+
+        async def query(holder):
+            async with semaphore:
+                try:
+                    found = await guild.query_members(query=holder, limit=5, cache=True)
+                except Exception as e:
+                    logger.warning(f"Member query for {holder} failed: {e}")
+                    return
+            for member in found:
+                index.add(member)
+            member = MemberIndex(found).find(holder)
+            if member:
+                members[holder] = member
+
+        await asyncio.gather(*(query(holder) for holder in missing))
+        return members
+
+    # Keep the built indexes in step with display name changes
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        index = self._member_indexes.get(member.guild.id)
+        if index is not None:
+            index.add(member)
 
-        return None
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        index = self._member_indexes.get(member.guild.id)
+        if index is not None:
+            index.remove(member)
 
-    def get_cell_value(self, spreadsheet, sheet_name, cell_address):
-        """Get value from a specific cell, handling merged cells"""
-        try:
-            sheet = spreadsheet.worksheet(sheet_name)
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.display_name == after.display_name:
+            return
+        index = self._member_indexes.get(after.guild.id)
+        if index is not None:
+            index.remove(before)
+            index.add(after)
 
-            # Handle merged cells (e.g., E14:F14)
-            if ":" in cell_address:
-                # For merged cells, get the first cell value
-                start_cell = cell_address.split(":")[0]
-                value = sheet.acell(start_cell).value
-            else:
-                value = sheet.acell(cell_address).value
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        # Global name changes show up as display names for members without a nick
+        if before.display_name == after.display_name:
+            return
+        for guild_id, index in self._member_indexes.items():
+            guild = self.bot.get_guild(guild_id)
+            member = guild.get_member(after.id) if guild else None
+            if member is not None:
+                index.remove(member)
+                index.add(member)
+
+    async def _with_retry(self, func, *args, retries=4):
+        """Run a blocking gspread call in a thread, backing off on 429/5xx"""
+        for attempt in range(retries + 1):
+            try:
+                return await asyncio.to_thread(func, *args)
+            except gspread.exceptions.APIError as e:
+                status = getattr(e.response, "status_code", None)
+                if status not in RETRYABLE_STATUSES or attempt == retries:
+                    raise
+                delay = 2 ** attempt + random.random()
+                logger.warning(
+                    f"Sheets API returned {status}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def _fetch_all_positions(self, spreadsheet):
+        """
+        Read every position cell in one values_batch_get request (one range per sheet).
+        Returns {(sheet_name, cell_address): value}, with "N/A" for empty cells.
+        """
+        try:
+            response = await self._with_retry(spreadsheet.values_batch_get, list(_RANGES))
+        except Exception as e:
+            logger.error(f"Error batch fetching staff positions: {e}")
+            # Auth failures may mean a stale handle; reopen on the next read
+            if isinstance(e, gspread.exceptions.APIError) and \
+                    getattr(e.response, "status_code", None) in (401, 403):
+                self._drop_spreadsheet()
+            return {}
+
+        # The API drops trailing empty rows and cells, so guard every index
+        grids = [value_range.get("values", []) for value_range in response.get("valueRanges", [])]
+
+        values = {}
+        for item in _CELL_POSITIONS:
+            range_index, row, col = _CELL_OFFSETS[item.sheet, item.cell]
+            grid = grids[range_index] if range_index < len(grids) else []
+            value = grid[row][col] if row < len(grid) and col < len(grid[row]) else ""
+            values[item.sheet, item.cell] = value.strip() if value and value.strip() else "N/A"
+        return values
+
+    async def _get_positions_cached(self, sheet_url):
+        """Return the position holders for sheet_url, reusing a read younger than the TTL"""
+        # Serialized so concurrent posts (e.g. the auto-post fan-out) share one read
+        async with self._cache_lock:
+            cached = self._cache.get(sheet_url)
+            if cached and monotonic() - cached[0] < STAFF_RATING_CACHE_TTL:
+                return cached[1]
+
+            try:
+                spreadsheet = await self._with_retry(self._open_spreadsheet, sheet_url)
+            except gspread.exceptions.SpreadsheetNotFound:
+                self._cache.pop(sheet_url, None)
+                self._drop_spreadsheet()
+                raise
+
+            holders = await self._fetch_all_positions(spreadsheet)
+            # Don't cache a failed read, so the next command retries
+            if holders:
+                self._cache[sheet_url] = (monotonic(), holders)
+            return holders
+
+    async def _send_intro_and_fetch(self, channel, intro_text, sheet_url):
+        """Send the intro message and read the sheet concurrently; returns the holders"""
+        holders_task = asyncio.create_task(self._get_positions_cached(sheet_url))
+        try:
+            intro_message = await channel.send(intro_text)
+        except BaseException:
+            holders_task.cancel()
+            raise
 
-            # Return "N/A" if empty
-            return value.strip() if value and value.strip() else "N/A"
+        try:
+            return await holders_task
+        except BaseException:
+            # Don't leave a role ping with no positions under it
+            with contextlib.suppress(discord.HTTPException):
+                await intro_message.delete()
+            raise
+
+    async def _send_positions(self, channel, holders, members, reactions):
+        """Send one message per position, each section header riding on its first position"""
+        # No sleeps between sends: discord.py's HTTP client waits on the
+        # channel's rate-limit bucket whenever Discord asks it to
+        reaction_tasks = []
+        pending_header = None
 
-        except Exception as e:
-            logger.error(
-                f"Error fetching {cell_address} from {sheet_name}: {e}")
-            return "N/A"
+        try:
+            for item in POSITIONS:
+                match item:
+                    case Header(text=header_text):
+                        # Sent together with the section's first position
+                        pending_header = header_text
+                    case Cell(sheet=sheet_name, cell=cell_address, title=position_title):
+                        # Get the current holder from the batch read
+                        holder = holders.get((sheet_name, cell_address), "N/A")
+                        member = members.get(holder)
+
+                        # Ping the member if found, otherwise show the plain username
+                        if member:
+                            message_text = f"{position_title} - {member.mention}"
+                        else:
+                            message_text = f"{position_title} - {holder}"
+
+                        if pending_header:
+                            message_text = f"{pending_header}\n{message_text}"
+                            pending_header = None
+
+                        # Each position keeps its own message so it gets its own reactions
+                        msg = await channel.send(message_text)
+
+                        # Add reactions in the background while the next message is sent
+                        reaction_tasks.append(asyncio.create_task(
+                            self._add_reactions(msg, reactions)))
+
+            # A header with no positions after it still goes out
+            if pending_header:
+                await channel.send(pending_header)
+
+            await asyncio.gather(*reaction_tasks)
+        finally:
+            # If a send failed, don't leave reactions running on the sent
+            # messages; they'd only error again with nobody awaiting them
+            for task in reaction_tasks:
+                task.cancel()
+            await asyncio.gather(*reaction_tasks, return_exceptions=True)
+
+    async def _add_reactions(self, msg, reactions):
+        """Add the rating reactions to one message, in order"""
+        # Sequential per message so the reactions keep their order; discord.py's
+        # rate limiter paces the calls, and different messages run concurrently
+        for emoji in reactions:
+            await msg.add_reaction(emoji)
 
     @app_commands.command(name="post_rating", description="Post the staff rating form")
     async def post_staff_rating(self, interaction: discord.Interaction):
@@ -196,8 +527,7 @@ class StaffRatingCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            self.setup_sheets_client()
-            if not self.client:
+            if self.client is None:
                 logger.error("Sheets client is None, cannot post rating")
                 return
             # Get the rating channel for this server
@@ -218,7 +548,7 @@ class StaffRatingCog(commands.Cog):
                 return
 
             # Get spreadsheet URL from config
-            sheet_url = config.STAFF_RATING.get('spreadsheet_url')
+            sheet_url = STAFF_RATING_SPREADSHEET_URL
             if not sheet_url:
                 await interaction.followup.send(
                     "❌ Spreadsheet URL not configured in config.yaml",
@@ -226,11 +556,7 @@ class StaffRatingCog(commands.Cog):
                 )
                 return
 
-            # Get reactions from config
-            reactions = config.STAFF_RATING.get('reactions', ["🟩", "🟨", "🟥"])
-
-            # Open spreadsheet
-            spreadsheet = self.client.open_by_url(sheet_url)
+            reactions = STAFF_RATING_REACTIONS
 
             # Send intro message
             intro_text = """<@&1269671417394499684>
@@ -239,43 +565,11 @@ As always, this rating is conducted to gather insight into how our staff team is
 Please be honest with your feedback, your responses will **not affect any promotions or demotions.** This is solely for internal review and continuous improvement.
 Your input helps us grow and improve our training environment, so we truly appreciate you taking the time to participate!"""
 
-            await channel.send(intro_text)
-            await asyncio.sleep(0.1)
-
-            # Process each position
-            for item in self.POSITIONS:
-                if item[0] == "header":
-                    # Send section header
-                    await channel.send(item[1])
-                    await asyncio.sleep(0.1)
-                else:
-                    sheet_name, cell_address, position_title = item
-
-                    # Get the current holder from spreadsheet
-                    holder = self.get_cell_value(
-                        spreadsheet, sheet_name, cell_address)
-
-                    # Try to find the Discord member
-                    member = self.find_member_by_username(
-                        interaction.guild, holder)
-
-                    # Format the message
-                    if member:
-                        # Found the member - ping them
-                        message_text = f"{position_title} - {member.mention}"
-                    else:
-                        # Member not found - show plain username
-                        message_text = f"{position_title} - {holder}"
+            # The sheet is read while the intro is being sent
+            holders = await self._send_intro_and_fetch(channel, intro_text, sheet_url)
 
-                    # Send message
-                    msg = await channel.send(message_text)
-
-                    # Add reactions
-                    for emoji in reactions:
-                        await msg.add_reaction(emoji)
-                        await asyncio.sleep(0.3)
-
-                    await asyncio.sleep(0.1)
+            members = await self.resolve_holders(interaction.guild, holders)
+            await self._send_positions(channel, holders, members, reactions)
 
             await interaction.followup.send(
                 "✅ Staff rating posted successfully!",
@@ -308,7 +602,7 @@ Your input helps us grow and improve our training environment, so we truly appre
 
         try:
             # Get spreadsheet URL from config
-            sheet_url = config.STAFF_RATING.get('spreadsheet_url')
+            sheet_url = STAFF_RATING_SPREADSHEET_URL
             if not sheet_url:
                 await interaction.followup.send(
                     "❌ Spreadsheet URL not configured in config.yaml",
@@ -316,31 +610,26 @@ Your input helps us grow and improve our training environment, so we truly appre
                 )
                 return
 
-            spreadsheet = self.client.open_by_url(sheet_url)
+            holders = await self._get_positions_cached(sheet_url)
 
-            preview_text = "**Staff Rating Preview:**\n\n"
+            members = await self.resolve_holders(interaction.guild, holders)
 
-            for item in self.POSITIONS:
-                if item[0] == "header":
-                    preview_text += f"\n{item[1]}\n"
-                else:
-                    sheet_name, cell_address, position_title = item
+            preview_text = "**Staff Rating Preview:**\n\n"
 
-                    holder = await asyncio.to_thread(
-                        self.get_cell_value,
-                        spreadsheet,
-                        sheet_name,
-                        cell_address
-                    )
+            for item in POSITIONS:
+                match item:
+                    case Header(text=header_text):
+                        preview_text += f"\n{header_text}\n"
+                    case Cell(sheet=sheet_name, cell=cell_address, title=position_title):
+                        holder = holders.get((sheet_name, cell_address), "N/A")
 
-                    # Try to find member
-                    member = self.find_member_by_username(
-                        interaction.guild, holder)
+                        # Try to find member
+                        member = members.get(holder)
 
-                    if member:
-                        preview_text += f"{position_title} - {member.mention} ✓\n"
-                    else:
-                        preview_text += f"{position_title} - {holder}\n"
+                        if member:
+                            preview_text += f"{position_title} - {member.mention} ✓\n"
+                        else:
+                            preview_text += f"{position_title} - {holder}\n"
 
             # Split into multiple messages if too long
             if len(preview_text) > 2000:
@@ -355,49 +644,51 @@ Your input helps us grow and improve our training environment, so we truly appre
             logger.error(f"Error previewing staff rating: {e}", exc_info=True)
             await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True)
 
-    # Runs every sunday at 21:00 PM UTC / 20:00 PM GMT+2
-    @tasks.loop(time=time(hour=21, minute=0))
+    # Runs every Sunday at 21:00 UTC (23:00 GMT+2); AUTO_POST_TIME is explicitly UTC
+    @tasks.loop()
     async def auto_post_rating(self):
         """Automatically post staff rating every Sunday"""
-        # Check if today is Sunday (weekday 6)
-        if datetime.utcnow().weekday() != 6:
-            return
+        # Sleep straight to the next Sunday slot instead of waking daily; each
+        # slot is derived from the last one so an early wake-up can't repeat it
+        run_at = next_auto_post(max(datetime.now(timezone.utc), self._last_auto_post))
+        await discord.utils.sleep_until(run_at)
+        self._last_auto_post = run_at
 
         logger.info("Auto-posting staff rating...")
 
-        try:
-            # Get all configured servers
-            servers = config.STAFF_RATING.get('servers', {})
-
-            for guild_id, server_config in servers.items():
-                # Skip if auto_post is disabled for this server
-                if not server_config.get('auto_post', False):
-                    continue
-
-                channel_id = server_config.get('rating_channel_id')
-                if not channel_id:
-                    logger.warning(
-                        f"No rating channel configured for guild {guild_id}")
-                    continue
-
-                channel = self.bot.get_channel(channel_id)
-                if not channel:
-                    logger.warning(
-                        f"Could not find channel {channel_id} for guild {guild_id}")
-                    continue
-
-                guild = self.bot.get_guild(guild_id)
-                if not guild:
-                    logger.warning(f"Could not find guild {guild_id}")
-                    continue
-
-                # Post the rating
+        semaphore = asyncio.Semaphore(AUTO_POST_CONCURRENCY)
+
+        async def post_to_guild(guild_id, server_config):
+            channel_id = server_config.get('rating_channel_id')
+            if not channel_id:
+                logger.warning(
+                    f"No rating channel configured for guild {guild_id}")
+                return
+
+            channel = self.bot.get_channel(channel_id)
+            if not channel:
+                logger.warning(
+                    f"Could not find channel {channel_id} for guild {guild_id}")
+                return
+
+            guild = self.bot.get_guild(guild_id)
+            if not guild:
+                logger.warning(f"Could not find guild {guild_id}")
+                return
+
+            # Post the rating; the sheet read is shared through the cache
+            async with semaphore:
                 await self._post_rating_to_channel(channel, guild)
-                logger.info(
-                    f"Successfully auto-posted staff rating to guild {guild_id}")
+            logger.info(
+                f"Successfully auto-posted staff rating to guild {guild_id}")
 
-                # Add delay between servers to avoid rate limits
-                await asyncio.sleep(2)
+        try:
+            # All configured servers with auto_post enabled, concurrently
+            await asyncio.gather(*(
+                post_to_guild(guild_id, server_config)
+                for guild_id, server_config in STAFF_RATING_SERVERS.items()
+                if server_config.get('auto_post', False)
+            ))
 
         except Exception as e:
             logger.error(f"Error in auto_post_rating: {e}", exc_info=True)
@@ -406,26 +697,22 @@ Your input helps us grow and improve our training environment, so we truly appre
     async def before_auto_post(self):
         """Wait until bot is ready before starting the loop"""
         await self.bot.wait_until_ready()
-        logger.info("Auto-post task waiting for Sunday at 12:00 PM UTC")
+        logger.info(
+            f"Auto-post task waiting for {next_auto_post(datetime.now(timezone.utc)):%A %Y-%m-%d %H:%M} UTC")
 
     async def _post_rating_to_channel(self, channel: discord.TextChannel, guild: discord.Guild):
         """Helper method to post rating to a specific channel"""
         try:
-            self.setup_sheets_client()
-            if not self.client:
+            if self.client is None:
                 logger.error("Sheets client is None, cannot post rating")
                 return
             # Get spreadsheet URL from config
-            sheet_url = config.STAFF_RATING.get('spreadsheet_url')
+            sheet_url = STAFF_RATING_SPREADSHEET_URL
             if not sheet_url:
                 logger.error("Spreadsheet URL not configured")
                 return
 
-            # Get reactions from config
-            reactions = config.STAFF_RATING.get('reactions', ["🟩", "🟨", "🟥"])
-
-            # Open spreadsheet
-            spreadsheet = self.client.open_by_url(sheet_url)
+            reactions = STAFF_RATING_REACTIONS
 
             # Send intro message
             intro_text = """<@&1269671417394499684>
@@ -434,32 +721,11 @@ As always, this rating is conducted to gather insight into how our staff team is
 Please be honest with your feedback, your responses will **not affect any promotions or demotions.** This is solely for internal review and continuous improvement.
 Your input helps us grow and improve our training environment, so we truly appreciate you taking the time to participate!"""
 
-            await channel.send(intro_text)
-            await asyncio.sleep(0.1)
-
-            # Process each position
-            for item in self.POSITIONS:
-                if item[0] == "header":
-                    await channel.send(item[1])
-                    await asyncio.sleep(0.1)
-                else:
-                    sheet_name, cell_address, position_title = item
-                    holder = self.get_cell_value(
-                        spreadsheet, sheet_name, cell_address)
-                    member = self.find_member_by_username(guild, holder)
-
-                    if member:
-                        message_text = f"{position_title} - {member.mention}"
-                    else:
-                        message_text = f"{position_title} - {holder}"
-
-                    msg = await channel.send(message_text)
-
-                    for emoji in reactions:
-                        await msg.add_reaction(emoji)
-                        await asyncio.sleep(0.3)
+            # The sheet is read while the intro is being sent
+            holders = await self._send_intro_and_fetch(channel, intro_text, sheet_url)
 
-                    await asyncio.sleep(0.1)
+            members = await self.resolve_holders(guild, holders)
+            await self._send_positions(channel, holders, members, reactions)
 
         except Exception as e:
             logger.error(
@@ -7,6 +7,24 @@ import yaml
 import os
 from typing import Any
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# Keys (in any top-level section) holding Discord IDs that are only ever
+# tested for membership, so they are stored as frozensets
+ID_LIST_KEYS = (
+    "bot_owners",
+    "test_servers",
+    "allowed_servers",
+    "allowed_roles",
+    "admin_roles",
+    "control_servers",
+)
+
 
 class Config:
     """Configuration manager that loads from YAML file"""
@@ -25,7 +43,18 @@ class Config:
             )
 
         with open(self.config_file, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            return self._freeze_id_lists(yaml.load(f, Loader=SafeLoader))
+
+    @staticmethod
+    def _freeze_id_lists(raw: dict) -> dict:
+        """Turn the ID lists used for membership checks into frozensets"""
+        for section in raw.values():
+            if not isinstance(section, dict):
+                continue
+            for key in ID_LIST_KEYS:
+                if key in section:
+                    section[key] = frozenset(section[key] or ())
+        return raw
 
     def reload(self):
         """Reload configuration from file"""
@@ -51,14 +80,14 @@ class Config:
 
     # Convenience properties for commonly used values
     @property
-    def bot_owners(self) -> list:
-        """List of bot owner IDs"""
-        return self.get('general', 'bot_owners', default=[])
+    def bot_owners(self) -> frozenset:
+        """Set of bot owner IDs"""
+        return self.get('general', 'bot_owners', default=frozenset())
 
     @property
-    def test_servers(self) -> list:
-        """List of test server IDs"""
-        return self.get('general', 'test_servers', default=[])
+    def test_servers(self) -> frozenset:
+        """Set of test server IDs"""
+        return self.get('general', 'test_servers', default=frozenset())
 
     @property
     def error_webhook_url(self) -> str:
@@ -74,14 +103,14 @@ class Config:
         """Check if guild is a test server"""
         return guild_id in self.test_servers
 
-    def has_permission(self, user_id: int, user_roles: list, allowed_roles: list) -> bool:
+    def has_permission(self, user_id: int, user_roles, allowed_roles) -> bool:
         """
         Check if user has permission based on roles or owner status
 
         Args:
             user_id: Discord user ID
-            user_roles: List of role IDs the user has
-            allowed_roles: List of role IDs that are allowed (empty = everyone)
+            user_roles: Iterable of role IDs the user has (or a Member's _roles)
+            allowed_roles: Set of role IDs that are allowed (empty = everyone)
 
         Returns:
             True if user has permission
@@ -94,16 +123,22 @@ class Config:
         if not allowed_roles:
             return True
 
-        # Check if user has any of the allowed roles
-        return any(role_id in allowed_roles for role_id in user_roles)
+        # discord.py's SnowflakeList (Member._roles) is sorted and has a
+        # bisect-backed has(); probe it once per allowed role
+        if hasattr(user_roles, "has"):
+            return any(user_roles.has(role_id) for role_id in allowed_roles)
 
-    def is_server_allowed(self, guild_id: int, allowed_servers: list) -> bool:
+        # Check if user has any of the allowed roles; frozenset() of a
+        # frozenset is the same object, so config values aren't copied
+        return not frozenset(allowed_roles).isdisjoint(user_roles)
+
+    def is_server_allowed(self, guild_id: int, allowed_servers) -> bool:
         """
         Check if command can be used in this server
 
         Args:
             guild_id: Discord guild ID
-            allowed_servers: List of allowed server IDs (empty = all servers)
+            allowed_servers: Set of allowed server IDs (empty = all servers)
 
         Returns:
             True if server is allowed
@@ -130,8 +165,8 @@ ERROR_WEBHOOK_URL = config.error_webhook_url
 
 # Export cog-specific configs
 FILTER_CHECK = {
-    "allowed_servers": config.get('filter_check', 'allowed_servers', default=[]),
-    "allowed_roles": config.get('filter_check', 'allowed_roles', default=[]),
+    "allowed_servers": config.get('filter_check', 'allowed_servers', default=frozenset()),
+    "allowed_roles": config.get('filter_check', 'allowed_roles', default=frozenset()),
     "result_channels": config.get('filter_check', 'result_channels', default={}),
     "main_group": config.get('filter_check', 'roblox', 'main_group'),
     "main_divisions": config.get('filter_check', 'roblox', 'main_divisions', default=[]),
@@ -145,30 +180,46 @@ FILTER_CHECK = {
 }
 
 BOT_MANAGEMENT = {
-    "allowed_servers": config.get('bot_management', 'allowed_servers', default=[]),
-    "allowed_roles": config.get('bot_management', 'allowed_roles', default=[]),
+    "allowed_servers": config.get('bot_management', 'allowed_servers', default=frozenset()),
+    "allowed_roles": config.get('bot_management', 'allowed_roles', default=frozenset()),
 }
 
 INVITE = {
     "target_guild_id": config.get('invite', 'target', 'guild_id'),
     "target_channel_id": config.get('invite', 'target', 'channel_id'),
-    "control_servers": config.get('invite', 'control_servers', default=[]),
+    "control_servers": config.get('invite', 'control_servers', default=frozenset()),
     "required_role_id": config.get('invite', 'required_role_id'),
-    "admin_roles": config.get('invite', 'admin_roles', default=[]),
+    "admin_roles": config.get('invite', 'admin_roles', default=frozenset()),
     "log_webhook_url": config.get('invite', 'log_webhook_url', default=''),
     "data_file": config.get('invite', 'data_file', default='invited_users.json'),
 }
 
+# Guilds the invite admin commands are registered in (control + test servers);
+# empty when no control servers are set, which keeps them global.
+# main.py syncs each of these after the global sync
+INVITE_COMMAND_GUILD_IDS = (
+    INVITE["control_servers"] | TEST_SERVER_IDS if INVITE["control_servers"] else frozenset()
+)
+
 STAFF_RATING = {
     "spreadsheet_url": config.get('staff_rating', 'spreadsheet', 'url'),
     "credentials": config.get('staff_rating', 'spreadsheet', 'credentials_file', default='credentials.json'),
     "command_sheet": config.get('staff_rating', 'spreadsheet', 'sheets', 'high_command', default='Info2'),
     "company_command_sheet": config.get('staff_rating', 'spreadsheet', 'sheets', 'company_command', default='Officers'),
     "servers": config.get('staff_rating', 'servers', default={}),
-    "admin_roles": config.get('staff_rating', 'admin_roles', default=[]),
-    "reactions": config.get('staff_rating', 'reactions', default=["🟩", "🟨", "🟥"])
+    "admin_roles": config.get('staff_rating', 'admin_roles', default=frozenset()),
+    "reactions": config.get('staff_rating', 'reactions', default=["🟩", "🟨", "🟥"]),
+    "cache_ttl_seconds": config.get('staff_rating', 'spreadsheet', 'cache_ttl_seconds', default=60)
 }
 
+# Staff rating values read on every command, bound once
+STAFF_RATING_SPREADSHEET_URL = STAFF_RATING["spreadsheet_url"]
+STAFF_RATING_CREDENTIALS = STAFF_RATING["credentials"]
+STAFF_RATING_SERVERS = STAFF_RATING["servers"]
+STAFF_RATING_ADMIN_ROLES = frozenset(STAFF_RATING["admin_roles"])
+STAFF_RATING_REACTIONS = tuple(STAFF_RATING["reactions"])
+STAFF_RATING_CACHE_TTL = STAFF_RATING["cache_ttl_seconds"]
+
 # Export helper functions
 is_bot_owner = config.is_bot_owner
 is_test_server = config.is_test_server
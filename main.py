@@ -4,6 +4,7 @@ import os
 import asyncio
 import logging
 from dotenv import load_dotenv
+import config
 
 # Load environment variables
 load_dotenv()
@@ -12,6 +13,9 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Synced first so new commands show up here without waiting on the global sync
+DEV_GUILD_ID = 1309981030790463529
+
 
 class CGBot(commands.Bot):
     def __init__(self):
@@ -37,7 +41,7 @@ class CGBot(commands.Bot):
         try:
             logger.info("Syncing commands...")
             # Sync to your specific guild first (faster for testing)
-            guild = discord.Object(id=1309981030790463529)
+            guild = discord.Object(id=DEV_GUILD_ID)
             self.tree.copy_global_to(guild=guild)
             await self.tree.sync(guild=guild)
             logger.info(f"Synced commands to guild {guild.id}")
@@ -48,6 +52,16 @@ class CGBot(commands.Bot):
         except Exception as e:
             logger.error(f"Failed to sync commands: {str(e)}")
 
+        # Guild-only commands (invite admin commands) reach the other
+        # control and test servers only through a per-guild sync. Each guild
+        # is synced on its own so one failing guild can't block the rest
+        for guild_id in config.INVITE_COMMAND_GUILD_IDS - {DEV_GUILD_ID}:
+            try:
+                await self.tree.sync(guild=discord.Object(id=guild_id))
+                logger.info(f"Synced commands to guild {guild_id}")
+            except Exception as e:
+                logger.error(f"Failed to sync commands to guild {guild_id}: {str(e)}")
+
     async def load_cogs(self):
         """Load all cogs from the cogs folder"""
         cog_files = [